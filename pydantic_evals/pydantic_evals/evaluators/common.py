@@ -2,7 +2,9 @@ from __future__ import annotations as _annotations
 
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Any, cast
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, cast
 
 from pydantic_ai import models
 from pydantic_ai.settings import ModelSettings
@@ -43,6 +45,10 @@ class EqualsExpected(Evaluator[object, object, object]):
         return ctx.output == ctx.expected_output
 
 
+# Shared by the evaluators below for checks that pass without a reason; results are only ever read, never mutated
+_PASSED = EvaluationReason(value=True)
+
+
 # _MAX_REASON_LENGTH = 500
 # _MAX_REASON_KEY_LENGTH = 30
 
@@ -89,37 +95,60 @@ class Contains(Evaluator[object, object, object]):
                 output_trunc = _truncated_repr(output_str, max_length=100)
                 expected_trunc = _truncated_repr(expected_str, max_length=100)
                 failure_reason = f'Output string {output_trunc} does not contain expected string {expected_trunc}'
-            return EvaluationReason(value=failure_reason is None, reason=failure_reason)
+            return _PASSED if failure_reason is None else EvaluationReason(value=False, reason=failure_reason)
 
+        # Dispatch on the exact output type, only falling back to a subclass check for other types
+        output_type = type(ctx.output)
+        check = _CONTAINS_CHECKS_BY_OUTPUT_TYPE.get(output_type)
+        if check is None:
+            check = _dict_contains if issubclass(output_type, dict) else _collection_contains
         try:
-            # Handle different collection types
-            if isinstance(ctx.output, dict):
-                if isinstance(self.value, dict):
-                    # Cast to Any to avoid type checking issues
-                    output_dict = cast(dict[Any, Any], ctx.output)  # pyright: ignore[reportUnknownMemberType]
-                    expected_dict = cast(dict[Any, Any], self.value)  # pyright: ignore[reportUnknownMemberType]
-                    for k in expected_dict:
-                        if k not in output_dict:
-                            k_trunc = _truncated_repr(k, max_length=30)
-                            failure_reason = f'Output dictionary does not contain expected key {k_trunc}'
-                            break
-                        elif output_dict[k] != expected_dict[k]:
-                            k_trunc = _truncated_repr(k, max_length=30)
-                            output_v_trunc = _truncated_repr(output_dict[k], max_length=100)
-                            expected_v_trunc = _truncated_repr(expected_dict[k], max_length=100)
-                            failure_reason = f'Output dictionary has different value for key {k_trunc}: {output_v_trunc} != {expected_v_trunc}'
-                            break
-                else:
-                    if self.value not in ctx.output:  # pyright: ignore[reportUnknownMemberType]
-                        output_trunc = _truncated_repr(ctx.output, max_length=200)  # pyright: ignore[reportUnknownMemberType]
-                        failure_reason = f'Output {output_trunc} does not contain provided value as a key'
-            elif self.value not in ctx.output:  # pyright: ignore[reportOperatorIssue]  # will be handled by except block
-                output_trunc = _truncated_repr(ctx.output, max_length=200)
-                failure_reason = f'Output {output_trunc} does not contain provided value'
+            failure_reason = check(ctx.output, self.value)
         except (TypeError, ValueError) as e:
             failure_reason = f'Containment check failed: {e}'
 
-        return EvaluationReason(value=failure_reason is None, reason=failure_reason)
+        return _PASSED if failure_reason is None else EvaluationReason(value=False, reason=failure_reason)
+
+
+def _dict_contains(output: Any, value: Any) -> str | None:
+    # Returns the reason the check failed, or None if `output` contains `value`
+    output_dict = cast(dict[Any, Any], output)
+    if isinstance(value, dict):
+        # Cast to Any to avoid type checking issues
+        expected_dict = cast(dict[Any, Any], value)
+        for k in expected_dict:
+            if k not in output_dict:
+                k_trunc = _truncated_repr(k, max_length=30)
+                return f'Output dictionary does not contain expected key {k_trunc}'
+            elif output_dict[k] != expected_dict[k]:
+                k_trunc = _truncated_repr(k, max_length=30)
+                output_v_trunc = _truncated_repr(output_dict[k], max_length=100)
+                expected_v_trunc = _truncated_repr(expected_dict[k], max_length=100)
+                return (
+                    f'Output dictionary has different value for key {k_trunc}: {output_v_trunc} != {expected_v_trunc}'
+                )
+    elif value not in output_dict:
+        output_trunc = _truncated_repr(output_dict, max_length=200)
+        return f'Output {output_trunc} does not contain provided value as a key'
+    return None
+
+
+def _collection_contains(output: Any, value: Any) -> str | None:
+    # Returns the reason the check failed, or None if `output` contains `value`
+    if value not in output:  # raises a TypeError, handled by the caller, if the output doesn't support `in`
+        output_trunc = _truncated_repr(output, max_length=200)
+        return f'Output {output_trunc} does not contain provided value'
+    return None
+
+
+_CONTAINS_CHECKS_BY_OUTPUT_TYPE: dict[type[Any], Callable[[Any, Any], str | None]] = {
+    dict: _dict_contains,
+    list: _collection_contains,
+    tuple: _collection_contains,
+    set: _collection_contains,
+    frozenset: _collection_contains,
+    str: _collection_contains,
+}
 
 
 @dataclass
@@ -129,14 +158,18 @@ class IsInstance(Evaluator[object, object, object]):
     type_name: str
 
     def evaluate(self, ctx: EvaluatorContext[object, object, object]) -> EvaluationReason:
-        output = ctx.output
-        for cls in type(output).__mro__:
-            if cls.__name__ == self.type_name or cls.__qualname__ == self.type_name:
-                return EvaluationReason(value=True)
-
-        reason = f'output is of type {type(output).__name__}'
-        if type(output).__qualname__ != type(output).__name__:
-            reason += f' (qualname: {type(output).__qualname__})'
+        output_type = type(ctx.output)
+        type_name = self.type_name
+        # The output's own type is the usual match, so check it before walking the rest of the MRO
+        if output_type.__name__ == type_name or output_type.__qualname__ == type_name:
+            return _PASSED
+        for cls in output_type.__mro__[1:]:
+            if cls.__name__ == type_name or cls.__qualname__ == type_name:
+                return _PASSED
+
+        reason = f'output is of type {output_type.__name__}'
+        if output_type.__qualname__ != output_type.__name__:
+            reason += f' (qualname: {output_type.__qualname__})'
         return EvaluationReason(value=False, reason=reason)
 
 
@@ -220,7 +253,15 @@ class Python(Evaluator[object, object, object]):
 
     def evaluate(self, ctx: EvaluatorContext[object, object, object]) -> EvaluatorOutput:
         # Evaluate the condition, exposing access to the evaluator context as `ctx`.
-        return eval(self.expression, {'ctx': ctx})
+        return eval(_compile_expression(self.expression), {'ctx': ctx})
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> CodeType:
+    # Python evaluators are often constructed with the same expression for many cases in a dataset, so share the
+    # compiled code between instances. This is called on first use rather than in `__init__`, so that a `SyntaxError`
+    # is raised when evaluating; `lru_cache` doesn't cache exceptions.
+    return compile(expression, '<Python>', 'eval')
 
 
 DEFAULT_EVALUATORS: tuple[type[Evaluator[object, object, object]], ...] = (
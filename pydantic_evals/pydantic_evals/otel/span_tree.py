@@ -4,7 +4,7 @@ import re
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from functools import cache
+from functools import cache, lru_cache
 from textwrap import indent
 from typing import TYPE_CHECKING, Any, Callable, Union
 
@@ -87,6 +87,12 @@ class SpanQuery(TypedDict, total=False):
     no_ancestor_has: SpanQuery
 
 
+@lru_cache(maxsize=128)
+def _compile_name_regex(pattern: str) -> re.Pattern[str]:
+    # A query is typically checked against every node in a tree, so compile each pattern once rather than per node
+    return re.compile(pattern)
+
+
 @dataclass(repr=False)
 class SpanNode:
     """A node in the span tree; provides references to parents/children for easy traversal and queries."""
@@ -271,8 +277,9 @@ class SpanNode:
             return False
         if (name_contains := query.get('name_contains')) and name_contains not in self.name:
             return False
-        if (name_matches_regex := query.get('name_matches_regex')) and not re.match(name_matches_regex, self.name):
-            return False
+        if name_matches_regex := query.get('name_matches_regex'):
+            if not _compile_name_regex(name_matches_regex).match(self.name):
+                return False
 
         # Attribute conditions
         if (has_attributes := query.get('has_attributes')) and not all(
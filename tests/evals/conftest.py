@@ -0,0 +1,40 @@
+from __future__ import annotations as _annotations
+
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from ..conftest import try_import
+
+with try_import() as imports_successful:
+    import logfire
+
+    from pydantic_evals.otel._context_in_memory_span_exporter import context_subtree
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_up_span_recording() -> Iterator[None]:
+    """Record a throwaway span tree once per session, so the first test that records spans doesn't pay the setup cost.
+
+    This imports logfire's span machinery and registers the in-memory exporter used by `context_subtree` up front.
+    """
+    if imports_successful():
+        logfire.configure(send_to_logfire=False, console=False)
+        with context_subtree():
+            with logfire.span('warmup'):
+                pass
+    yield
+
+
+@pytest.fixture(scope='package')
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture(scope='package', autouse=True)
+async def shared_event_loop() -> AsyncIterator[None]:
+    """Hold the anyio test runner open for the whole package, so async tests share one event loop.
+
+    anyio only tears down its runner once no async fixture is using it, rather than after every test.
+    """
+    yield
@@ -1,19 +1,23 @@
 from __future__ import annotations as _annotations
 
+import builtins
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import timedelta
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
 import pytest
 from inline_snapshot import snapshot
 from pytest_mock import MockerFixture
 
+from pydantic_ai.models import KnownModelName
 from pydantic_ai.settings import ModelSettings
 
 from ..conftest import try_import
 
 with try_import() as imports_successful:
     import logfire
-    from logfire.testing import CaptureLogfire
 
     from pydantic_evals.evaluators import EvaluationReason, EvaluatorContext
     from pydantic_evals.evaluators.common import (
@@ -26,38 +30,188 @@ with try_import() as imports_successful:
         LLMJudge,
         MaxDuration,
         Python,
+        _compile_expression,  # pyright: ignore[reportPrivateUsage]
     )
     from pydantic_evals.otel._context_in_memory_span_exporter import context_subtree
     from pydantic_evals.otel._errors import SpanTreeRecordingError
-    from pydantic_evals.otel.span_tree import SpanQuery
+    from pydantic_evals.otel.span_tree import SpanQuery, SpanTree
 
-pytestmark = [pytest.mark.skipif(not imports_successful(), reason='pydantic-evals not installed'), pytest.mark.anyio]
+# Evaluated once here rather than wherever availability is checked below
+PYDANTIC_EVALS_AVAILABLE = imports_successful()
 
+pytestmark = pytest.mark.skipif(not PYDANTIC_EVALS_AVAILABLE, reason='pydantic-evals not installed')
 
-if TYPE_CHECKING or imports_successful():
 
+if TYPE_CHECKING or PYDANTIC_EVALS_AVAILABLE:
+
+    @dataclass
     class MockContext(EvaluatorContext[Any, Any, Any]):
-        def __init__(self, output: Any = None, expected_output: Any = None, inputs: Any = None, duration: float = 0.0):
-            self.output = output
-            self.expected_output = expected_output
-            self.inputs = inputs
-            self.duration = duration
+        """An `EvaluatorContext` with defaults for every field, so tests only pass what the evaluator reads."""
+
+        name: str | None = None
+        inputs: Any = None
+        metadata: Any = None
+        expected_output: Any = None
+        output: Any = None
+        duration: float = 0.0
+        _span_tree: SpanTree | SpanTreeRecordingError = field(
+            default_factory=lambda: SpanTreeRecordingError('spans were not recorded'), repr=False
+        )
+        attributes: dict[str, Any] = field(default_factory=dict)
+        metrics: dict[str, int | float] = field(default_factory=dict)
+
+    class OuterClass:
+        class InnerClass:
+            pass
+
+    # Evaluators hold no per-evaluation state, so each one is built once and shared by the parametrized cases below
+    equals_42 = Equals(value=42)
+    contains_test = Contains(value='test')
+    contains_test_case_insensitive = Contains(value='TEST', case_sensitive=False)
+    contains_key_value = Contains(value={'key': 'value'})
+    contains_key = Contains(value='key')
+    contains_42 = Contains(value=42)
+    is_instance_str = IsInstance(type_name='str')
+    is_instance_inner_class = IsInstance(type_name='InnerClass')
+    is_instance_int = IsInstance(type_name='int')
+    max_duration_float = MaxDuration(seconds=1.0)
+    max_duration_timedelta = MaxDuration(seconds=timedelta(seconds=1))
+
+    # Expected IsInstance results, built once rather than in every parametrized case
+    _PASSED = EvaluationReason(value=True)
+    _IS_INSTANCE_INT = EvaluationReason(value=False, reason='output is of type int')
+
+    contains_string_cases = [
+        # string containment
+        (contains_test, 'this is a test', True, None),
+        # string non-containment
+        (contains_test, 'no match', False, "Output string 'no match' does not contain expected string 'test'"),
+        # case insensitivity
+        (contains_test_case_insensitive, 'this is a test', True, None),
+    ]
+    contains_dict_cases = [
+        # dictionary containment
+        (contains_key_value, {'key': 'value', 'extra': 'data'}, True, None),
+        # dictionary key missing
+        (contains_key_value, {'different': 'value'}, False, "Output dictionary does not contain expected key 'key'"),
+        # dictionary value mismatch
+        (
+            contains_key_value,
+            {'key': 'different'},
+            False,
+            "Output dictionary has different value for key 'key': 'different' != 'value'",
+        ),
+        # non-dict value in dict
+        (contains_key, {'key': 'value'}, True, None),
+        # dict subclasses are checked like dicts
+        (contains_key_value, OrderedDict([('key', 'value')]), True, None),
+        (
+            contains_key_value,
+            OrderedDict([('key', 'different')]),
+            False,
+            "Output dictionary has different value for key 'key': 'different' != 'value'",
+        ),
+    ]
+    contains_list_cases = [
+        # list containment
+        (contains_42, [1, 42, 3], True, None),
+        # list non-containment
+        (contains_42, [1, 2, 3], False, 'Output [1, 2, 3] does not contain provided value'),
+    ]
+    is_instance_cases = [
+        # matching type
+        (is_instance_str, 'test', _PASSED),
+        # non-matching type
+        (is_instance_str, 42, _IS_INSTANCE_INT),
+        # class having different qualname
+        (is_instance_inner_class, OuterClass.InnerClass(), _PASSED),
+        # matching a base class
+        (is_instance_int, True, _PASSED),
+    ]
+    max_duration_cases = [
+        # float seconds
+        (max_duration_float, 0.5, True),
+        (max_duration_float, 1.5, False),
+        # timedelta
+        (max_duration_timedelta, 0.5, True),
+        (max_duration_timedelta, 1.5, False),
+    ]
+    span_query_cases: list[tuple[SpanQuery, bool]] = [
+        # matching by name
+        (SpanQuery(name_equals='child1'), True),
+        # matching by name pattern
+        (SpanQuery(name_matches_regex='child.*'), True),
+        # matching by attributes
+        (SpanQuery(has_attributes={'key': 'value'}), True),
+        # matching nested span
+        (SpanQuery(name_equals='grandchild', has_attributes={'nested': True}), True),
+        # non-matching query
+        (SpanQuery(name_equals='nonexistent'), False),
+        # non-matching attributes
+        (SpanQuery(name_equals='child1', has_attributes={'wrong': 'value'}), False),
+    ]
 else:
     MockContext = object
+    contains_string_cases = contains_dict_cases = contains_list_cases = is_instance_cases = max_duration_cases = []
+    span_query_cases = []
 
 
-async def test_equals():
-    """Test Equals evaluator."""
-    evaluator = Equals(value=42)
+@pytest.fixture(scope='module')
+def judge_ctx() -> EvaluatorContext[Any, Any, Any]:
+    """A context shared by the `LLMJudge` tests; evaluators only read from it."""
+    return EvaluatorContext(
+        name='test',
+        inputs={'prompt': 'Hello'},
+        metadata=None,
+        expected_output=None,
+        output='Hello world',
+        duration=0.0,
+        _span_tree=SpanTreeRecordingError('spans were not recorded'),
+        attributes={},
+        metrics={},
+    )
 
-    # Test equal values
-    assert evaluator.evaluate(MockContext(output=42)) is True
 
-    # Test unequal values
-    assert evaluator.evaluate(MockContext(output=43)) is False
+@pytest.fixture
+def grading_output() -> SimpleNamespace:
+    """A stand-in for the `GradingOutput` returned by the judge functions; tests may flip its fields."""
+    return SimpleNamespace(pass_=True, reason='Test passed')
+
+
+@pytest.fixture
+def judge_mocks(mocker: MockerFixture, grading_output: SimpleNamespace) -> SimpleNamespace:
+    """Patch `judge_output` and `judge_input_output` to return `grading_output`; mocker undoes the patches after the test."""
+    return SimpleNamespace(
+        output=mocker.patch('pydantic_evals.evaluators.llm_as_a_judge.judge_output', return_value=grading_output),
+        input_output=mocker.patch(
+            'pydantic_evals.evaluators.llm_as_a_judge.judge_input_output', return_value=grading_output
+        ),
+    )
+
+
+@pytest.fixture(scope='module')
+def python_ctx() -> EvaluatorContext[Any, Any, Any]:
+    """A context shared by the `Python` evaluator tests; evaluators only read from it."""
+    return EvaluatorContext(
+        name='test',
+        inputs={'x': 42},
+        metadata=None,
+        expected_output=None,
+        output={'y': 84},
+        duration=0.0,
+        _span_tree=SpanTreeRecordingError('did not record spans'),
+        attributes={},
+        metrics={},
+    )
+
+
+@pytest.mark.parametrize('output,expected', [(42, True), (43, False)])
+def test_equals(output: Any, expected: bool):
+    """Test Equals evaluator."""
+    assert equals_42.evaluate(MockContext(output=output)) is expected
 
 
-async def test_equals_expected():
+def test_equals_expected():
     """Test EqualsExpected evaluator."""
     evaluator = EqualsExpected()
 
@@ -71,66 +225,38 @@ async def test_equals_expected():
     assert evaluator.evaluate(MockContext(output=42, expected_output=None)) == {}
 
 
-async def test_contains_string():
+@pytest.mark.parametrize('evaluator,output,value,reason', contains_string_cases)
+def test_contains_string(evaluator: Contains, output: Any, value: bool, reason: str | None):
     """Test Contains evaluator with strings."""
-    evaluator = Contains(value='test')
+    res = evaluator.evaluate(MockContext(output=output))
+    assert res.value is value
+    assert res.reason == reason
 
-    # Test string containment
-    assert evaluator.evaluate(MockContext(output='this is a test')).value is True
 
-    # Test string non-containment
-    assert evaluator.evaluate(MockContext(output='no match')) == snapshot(
+def test_contains_string_reason():
+    """Test the full reason reported when a string is not contained; kept as a snapshot since it documents the message."""
+    assert contains_test.evaluate(MockContext(output='no match')) == snapshot(
         EvaluationReason(value=False, reason="Output string 'no match' does not contain expected string 'test'")
     )
 
-    # Test case sensitivity
-    evaluator_case_insensitive = Contains(value='TEST', case_sensitive=False)
-    assert evaluator_case_insensitive.evaluate(MockContext(output='this is a test')) == snapshot(
-        EvaluationReason(value=True)
-    )
-
 
-async def test_contains_dict():
+@pytest.mark.parametrize('evaluator,output,value,reason', contains_dict_cases)
+def test_contains_dict(evaluator: Contains, output: Any, value: bool, reason: str | None):
     """Test Contains evaluator with dictionaries."""
-    evaluator = Contains(value={'key': 'value'})
-
-    # Test dictionary containment
-    assert evaluator.evaluate(MockContext(output={'key': 'value', 'extra': 'data'})) == snapshot(
-        EvaluationReason(value=True)
-    )
-
-    # Test dictionary key missing
-    assert evaluator.evaluate(MockContext(output={'different': 'value'})) == snapshot(
-        EvaluationReason(value=False, reason="Output dictionary does not contain expected key 'key'")
-    )
-
-    # Test dictionary value mismatch
-    assert evaluator.evaluate(MockContext(output={'key': 'different'})) == snapshot(
-        EvaluationReason(
-            value=False,
-            reason="Output dictionary has different value for key 'key': 'different' != 'value'",
-        )
-    )
-
-    # Test non-dict value in dict
-    evaluator_single = Contains(value='key')
-    assert evaluator_single.evaluate(MockContext(output={'key': 'value'})) == snapshot(EvaluationReason(value=True))
+    res = evaluator.evaluate(MockContext(output=output))
+    assert res.value is value
+    assert res.reason == reason
 
 
-async def test_contains_list():
+@pytest.mark.parametrize('evaluator,output,value,reason', contains_list_cases)
+def test_contains_list(evaluator: Contains, output: Any, value: bool, reason: str | None):
     """Test Contains evaluator with lists."""
-    evaluator = Contains(value=42)
-
-    # Test list containment
-    assert evaluator.evaluate(MockContext(output=[1, 42, 3])) == snapshot(EvaluationReason(value=True))
-
-    # Test list non-containment
-    assert evaluator.evaluate(MockContext(output=[1, 2, 3])) == snapshot(
-        EvaluationReason(value=False, reason='Output [1, 2, 3] does not contain provided value')
-    )
+    res = evaluator.evaluate(MockContext(output=output))
+    assert res.value is value
+    assert res.reason == reason
 
 
-async def test_contains_as_strings():
+def test_contains_as_strings():
     """Test Contains evaluator with as_strings=True."""
     evaluator = Contains(value=42, as_strings=True)
 
@@ -141,7 +267,7 @@ async def test_contains_as_strings():
     assert evaluator.evaluate(MockContext(output=[1, 42, 3])).value is True
 
 
-async def test_contains_invalid_type():
+def test_contains_invalid_type():
     """Test Contains evaluator with invalid types."""
     evaluator = Contains(value=42)
 
@@ -154,207 +280,106 @@ async def test_contains_invalid_type():
     assert result.reason == "Containment check failed: argument of type 'Unhashable' is not iterable"
 
 
-async def test_is_instance():
+@pytest.mark.parametrize('evaluator,output,expected', is_instance_cases)
+def test_is_instance(evaluator: IsInstance, output: Any, expected: EvaluationReason):
     """Test IsInstance evaluator."""
-    evaluator = IsInstance(type_name='str')
+    assert evaluator.evaluate(MockContext(output=output)) == expected
 
-    # Test matching type
-    assert evaluator.evaluate(MockContext(output='test')).value is True
 
-    # Test non-matching type
-    result = evaluator.evaluate(MockContext(output=42))
-    assert result.value is False
-    assert result.reason == 'output is of type int'
-
-    # Test with class having different qualname
-    class OuterClass:
-        class InnerClass:
-            pass
-
-    evaluator = IsInstance(type_name='InnerClass')
-    result = evaluator.evaluate(MockContext(output=OuterClass.InnerClass()))
-    assert result.value is True
-
-
-async def test_max_duration():
+@pytest.mark.parametrize('evaluator,duration,expected', max_duration_cases)
+def test_max_duration(evaluator: MaxDuration, duration: float, expected: bool):
     """Test MaxDuration evaluator."""
-    # Test with float seconds
-    evaluator = MaxDuration(seconds=1.0)
-    assert evaluator.evaluate(MockContext(duration=0.5)) is True
-    assert evaluator.evaluate(MockContext(duration=1.5)) is False
-
-    # Test with timedelta
-    evaluator = MaxDuration(seconds=timedelta(seconds=1))
-    assert evaluator.evaluate(MockContext(duration=0.5)) is True
-    assert evaluator.evaluate(MockContext(duration=1.5)) is False
+    assert evaluator.evaluate(MockContext(duration=duration)) is expected
 
 
 @pytest.mark.anyio
-async def test_llm_judge_evaluator(mocker: MockerFixture):
+@pytest.mark.parametrize(
+    'include_input,model,model_settings',
+    [
+        (False, None, None),
+        (True, 'openai:gpt-4o', None),
+        (False, None, ModelSettings(temperature=0.77)),
+        (True, 'openai:gpt-3.5-turbo', ModelSettings(temperature=0.77)),
+    ],
+)
+@pytest.mark.parametrize('pass_', [True, False])
+async def test_llm_judge_evaluator(
+    judge_ctx: EvaluatorContext[Any, Any, Any],
+    judge_mocks: SimpleNamespace,
+    grading_output: SimpleNamespace,
+    include_input: bool,
+    model: KnownModelName | None,
+    model_settings: ModelSettings | None,
+    pass_: bool,
+):
     """Test LLMJudge evaluator."""
-    # Create a mock GradingOutput
-    mock_grading_output = mocker.MagicMock()
-    mock_grading_output.pass_ = True
-    mock_grading_output.reason = 'Test passed'
-
-    # Mock the judge_output function
-    mock_judge_output = mocker.patch('pydantic_evals.evaluators.llm_as_a_judge.judge_output')
-    mock_judge_output.return_value = mock_grading_output
-
-    # Mock the judge_input_output function
-    mock_judge_input_output = mocker.patch('pydantic_evals.evaluators.llm_as_a_judge.judge_input_output')
-    mock_judge_input_output.return_value = mock_grading_output
+    grading_output.pass_ = pass_
+    grading_output.reason = 'Test passed' if pass_ else 'Test failed'
 
-    ctx = EvaluatorContext(
-        name='test',
-        inputs={'prompt': 'Hello'},
-        metadata=None,
-        expected_output=None,
-        output='Hello world',
-        duration=0.0,
-        _span_tree=SpanTreeRecordingError('spans were not recorded'),
-        attributes={},
-        metrics={},
-    )
-
-    # Test without input
-    evaluator = LLMJudge(rubric='Content contains a greeting')
-    result = await evaluator.evaluate(ctx)
-    assert isinstance(result, EvaluationReason)
-    assert result.value is True
-    assert result.reason == 'Test passed'
-
-    mock_judge_output.assert_called_once_with('Hello world', 'Content contains a greeting', None, None)
-
-    # Test with input
-    evaluator = LLMJudge(rubric='Output contains input', include_input=True, model='openai:gpt-4o')
-    result = await evaluator.evaluate(ctx)
-    assert isinstance(result, EvaluationReason)
-    assert result.value is True
-    assert result.reason == 'Test passed'
-
-    mock_judge_input_output.assert_called_once_with(
-        {'prompt': 'Hello'}, 'Hello world', 'Output contains input', 'openai:gpt-4o', None
+    evaluator = LLMJudge(
+        rubric='Content contains a greeting', model=model, include_input=include_input, model_settings=model_settings
     )
+    result = await evaluator.evaluate(judge_ctx)
+    assert result == EvaluationReason(value=pass_, reason=grading_output.reason)
 
-    # Test with failing result
-    mock_grading_output.pass_ = False
-    mock_grading_output.reason = 'Test failed'
-    result = await evaluator.evaluate(ctx)
-    assert isinstance(result, EvaluationReason)
-    assert result.value is False
-    assert result.reason == 'Test failed'
-
-
-@pytest.mark.anyio
-async def test_llm_judge_evaluator_with_model_settings(mocker: MockerFixture):
-    """Test LLMJudge evaluator with specific model_settings."""
-    mock_grading_output = mocker.MagicMock()
-    mock_grading_output.pass_ = True
-    mock_grading_output.reason = 'Test passed with settings'
-
-    mock_judge_output = mocker.patch('pydantic_evals.evaluators.llm_as_a_judge.judge_output')
-    mock_judge_output.return_value = mock_grading_output
-
-    mock_judge_input_output = mocker.patch('pydantic_evals.evaluators.llm_as_a_judge.judge_input_output')
-    mock_judge_input_output.return_value = mock_grading_output
-
-    custom_model_settings = ModelSettings(temperature=0.77)
-
-    ctx = EvaluatorContext(
-        name='test_custom_settings',
-        inputs={'prompt': 'Hello Custom'},
-        metadata=None,
-        expected_output=None,
-        output='Hello world custom settings',
-        duration=0.0,
-        _span_tree=SpanTreeRecordingError('spans were not recorded'),
-        attributes={},
-        metrics={},
-    )
-
-    # Test without input, with custom model_settings
-    evaluator_no_input = LLMJudge(rubric='Greeting with custom settings', model_settings=custom_model_settings)
-    result_no_input = await evaluator_no_input.evaluate(ctx)
-    assert result_no_input.value is True
-    assert result_no_input.reason == 'Test passed with settings'
-    mock_judge_output.assert_called_once_with(
-        'Hello world custom settings', 'Greeting with custom settings', None, custom_model_settings
-    )
-
-    # Test with input, with custom model_settings
-    evaluator_with_input = LLMJudge(
-        rubric='Output contains input with custom settings',
-        include_input=True,
-        model='openai:gpt-3.5-turbo',
-        model_settings=custom_model_settings,
-    )
-    result_with_input = await evaluator_with_input.evaluate(ctx)
-    assert result_with_input.value is True
-    assert result_with_input.reason == 'Test passed with settings'
-    mock_judge_input_output.assert_called_once_with(
-        {'prompt': 'Hello Custom'},
-        'Hello world custom settings',
-        'Output contains input with custom settings',
-        'openai:gpt-3.5-turbo',
-        custom_model_settings,
-    )
+    if include_input:
+        judge_mocks.input_output.assert_called_once_with(
+            {'prompt': 'Hello'}, 'Hello world', 'Content contains a greeting', model, model_settings
+        )
+        judge_mocks.output.assert_not_called()
+    else:
+        judge_mocks.output.assert_called_once_with('Hello world', 'Content contains a greeting', model, model_settings)
+        judge_mocks.input_output.assert_not_called()
 
 
-async def test_python():
+def test_python(mocker: MockerFixture):
     """Test Python evaluator."""
+    _compile_expression.cache_clear()
+    compile_spy = mocker.spy(builtins, 'compile')
     evaluator = Python(expression='ctx.output > 0')
 
     # Test with valid expression
     assert evaluator.evaluate(MockContext(output=42)) is True
     assert evaluator.evaluate(MockContext(output=-1)) is False
 
+    # The compiled expression is shared between evaluators, so it is only compiled once
+    assert Python(expression='ctx.output > 0').evaluate(MockContext(output=1)) is True
+    compile_spy.assert_called_once_with('ctx.output > 0', '<Python>', 'eval')
+
     # Test with invalid expression
     evaluator_invalid = Python(expression='invalid syntax')
     with pytest.raises(SyntaxError):
         evaluator_invalid.evaluate(MockContext(output=42))
 
 
-async def test_python_evaluator():
+def test_python_evaluator(python_ctx: EvaluatorContext[Any, Any, Any]):
     """Test Python evaluator."""
-    ctx = EvaluatorContext(
-        name='test',
-        inputs={'x': 42},
-        metadata=None,
-        expected_output=None,
-        output={'y': 84},
-        duration=0.0,
-        _span_tree=SpanTreeRecordingError('did not record spans'),
-        attributes={},
-        metrics={},
-    )
-
     # Test simple expression
     evaluator = Python(expression='ctx.output["y"] == 84')
-    assert evaluator.evaluate(ctx) is True
+    assert evaluator.evaluate(python_ctx) is True
 
     # Test accessing inputs
     evaluator = Python(expression='ctx.inputs["x"] * 2 == ctx.output["y"]')
-    assert evaluator.evaluate(ctx) is True
+    assert evaluator.evaluate(python_ctx) is True
 
     # Test complex expression
     evaluator = Python(expression='all(k in ctx.output for k in ["y"])')
-    assert evaluator.evaluate(ctx) is True
+    assert evaluator.evaluate(python_ctx) is True
 
     # Test invalid expression
     evaluator = Python(expression='invalid syntax')
     with pytest.raises(SyntaxError):
-        evaluator.evaluate(ctx)
+        evaluator.evaluate(python_ctx)
 
     # Test expression with undefined variables
     evaluator = Python(expression='undefined_var')
     with pytest.raises(NameError):
-        evaluator.evaluate(ctx)
+        evaluator.evaluate(python_ctx)
 
     # Test expression with type error
     evaluator = Python(expression='ctx.output + 1')  # Can't add dict and int
     with pytest.raises(TypeError):
-        evaluator.evaluate(ctx)
+        evaluator.evaluate(python_ctx)
 
 
 def test_default_evaluators():
@@ -363,9 +388,10 @@ def test_default_evaluators():
     assert Python not in DEFAULT_EVALUATORS
 
 
-async def test_span_query_evaluator(capfire: CaptureLogfire):
-    """Test HasMatchingSpan evaluator."""
-    # Create a span tree with a known structure
+@pytest.fixture(scope='module')
+def span_tree() -> SpanTree:
+    """A span tree with a known structure, built once and shared by the `HasMatchingSpan` tests."""
+    # logfire is configured by the session-wide warm-up in conftest.py; the tree is plain data once the context exits
     with context_subtree() as tree:
         with logfire.span('root'):
             with logfire.span('child1', key='value'):
@@ -373,39 +399,12 @@ async def test_span_query_evaluator(capfire: CaptureLogfire):
             with logfire.span('child2'):
                 with logfire.span('grandchild', nested=True):
                     pass
+    assert isinstance(tree, SpanTree)
+    return tree
 
-    ctx = EvaluatorContext(
-        name='test',
-        inputs={},
-        metadata=None,
-        expected_output=None,
-        output={},
-        duration=0.0,
-        _span_tree=tree,
-        attributes={},
-        metrics={},
-    )
-
-    # Test matching by name
-    evaluator = HasMatchingSpan(query=SpanQuery(name_equals='child1'))
-    assert evaluator.evaluate(ctx) is True
-
-    # Test matching by name pattern
-    evaluator = HasMatchingSpan(query=SpanQuery(name_matches_regex='child.*'))
-    assert evaluator.evaluate(ctx) is True
-
-    # Test matching by attributes
-    evaluator = HasMatchingSpan(query=SpanQuery(has_attributes={'key': 'value'}))
-    assert evaluator.evaluate(ctx) is True
 
-    # Test matching nested span
-    evaluator = HasMatchingSpan(query=SpanQuery(name_equals='grandchild', has_attributes={'nested': True}))
-    assert evaluator.evaluate(ctx) is True
-
-    # Test non-matching query
-    evaluator = HasMatchingSpan(query=SpanQuery(name_equals='nonexistent'))
-    assert evaluator.evaluate(ctx) is False
-
-    # Test non-matching attributes
-    evaluator = HasMatchingSpan(query=SpanQuery(name_equals='child1', has_attributes={'wrong': 'value'}))
-    assert evaluator.evaluate(ctx) is False
+@pytest.mark.parametrize('query,expected', span_query_cases)
+def test_span_query_evaluator(span_tree: SpanTree, query: SpanQuery, expected: bool):
+    """Test HasMatchingSpan evaluator."""
+    evaluator = HasMatchingSpan(query=query)
+    assert evaluator.evaluate(MockContext(output={}, _span_tree=span_tree)) is expected